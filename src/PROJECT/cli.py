@@ -6,23 +6,26 @@ A command-line interface for validating Dublin Core metadata in YAML format
 using Typer and the dublin_core_validator module.
 """
 
+import hashlib
 import json
+import os
 import sys
-from pathlib import Path
-from typing import Optional, List
+from fnmatch import fnmatch
+from functools import lru_cache
+from pathlib import Path, PurePath
+from itertools import chain
+from types import ModuleType
+from typing import Dict, Generator, Iterable, Iterator, Optional, List, Tuple, cast
 from enum import Enum
 
 import typer
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.syntax import Syntax
-from rich.tree import Tree
-from rich import print as rprint
 
-# Import the validator
-from validator import validate_dublin_core_yaml, validate_example_yaml, DublinCoreDocument
+# Heavier modules (the validator, Pydantic, and the Rich progress and syntax
+# renderers) are imported inside the commands that need them, keeping
+# `--help`, `info` and argument errors fast.
 
 app = typer.Typer(
     name="dc-validator",
@@ -33,6 +36,9 @@ app = typer.Typer(
 
 console = Console()
 
+# Files handed to each batch worker per round trip
+BATCH_CHUNKSIZE = 16
+
 
 class OutputFormat(str, Enum):
     """Output format options"""
@@ -50,12 +56,29 @@ class VerbosityLevel(str, Enum):
     DEBUG = "debug"
 
 
+def print_table(table: Table) -> None:
+    """Print a Rich table, or plain tab-separated rows when not on a terminal"""
+    if console.is_terminal:
+        console.print(table)
+        return
+    
+    # Redirected output gets plain rows instead of a box-drawn layout
+    if table.title:
+        console.print(table.title, highlight=False)
+    lines = ["\t".join(str(column.header) for column in table.columns)]
+    lines.extend(
+        "\t".join(str(cell) for cell in row)
+        for row in zip(*(column.cells for column in table.columns))
+    )
+    console.print("\n".join(lines), highlight=False, soft_wrap=True)
+
+
 def print_validation_summary(result: dict, show_details: bool = False):
     """Print a formatted validation summary"""
     status = result.get('validation_status', 'UNKNOWN')
     
     # Status panel with color coding
-    status_color = "green" if status == "PASSED" else "red"
+    status_color = {"PASSED": "green", "UNVALIDATED": "yellow"}.get(status, "red")
     status_panel = Panel(
         f"[bold {status_color}]{status}[/bold {status_color}]",
         title="Validation Status",
@@ -85,12 +108,20 @@ def print_validation_summary(result: dict, show_details: bool = False):
     table.add_row("Additional Metadata", "Yes" if result.get('has_additional_metadata') else "No")
     table.add_row("Metadata Record", "Yes" if result.get('has_metadata_record') else "No")
     
-    console.print(table)
+    print_table(table)
     
     if show_details and 'element_counts' in result:
         print_element_details(result['element_counts'])
 
 
+@lru_cache(maxsize=None)
+def element_labels() -> Dict[str, str]:
+    """Display labels for the Dublin Core elements, built on first use"""
+    from validator import DUBLIN_CORE_ELEMENTS
+    
+    return {name: name.replace('_', ' ').title() for name in DUBLIN_CORE_ELEMENTS}
+
+
 def print_element_details(element_counts: dict):
     """Print detailed element count information"""
     table = Table(title="Dublin Core Elements", show_header=True, header_style="bold blue")
@@ -98,26 +129,62 @@ def print_element_details(element_counts: dict):
     table.add_column("Count", justify="right", style="green")
     table.add_column("Status", justify="center")
     
-    for element, count in element_counts.items():
-        status = "✓" if count > 0 else "○"
-        status_style = "green" if count > 0 else "dim"
-        table.add_row(
-            element.replace('_', ' ').title(),
+    # Build every row up front, then hand them to the table in one pass
+    labels = element_labels()
+    rows = [
+        (
+            labels.get(element) or element.replace('_', ' ').title(),
             str(count),
-            f"[{status_style}]{status}[/{status_style}]"
+            "[green]✓[/green]" if count > 0 else "[dim]○[/dim]"
         )
+        for element, count in element_counts.items()
+    ]
+    for row in rows:
+        table.add_row(*row)
     
-    console.print(table)
+    print_table(table)
+
+
+@lru_cache(maxsize=None)
+def _get_orjson() -> Optional[ModuleType]:
+    """Import orjson on first use, or None when the 'fast' extra is not installed"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def dump_json(result: dict, pretty: bool = True) -> bytes:
+    """Serialize results to UTF-8 JSON, using orjson when it is installed"""
+    orjson = _get_orjson()
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        data: bytes = orjson.dumps(result, option=option, default=str)
+        return data
+    return json.dumps(result, indent=2 if pretty else None, default=str).encode('utf-8')
 
 
 def print_json_output(result: dict, pretty: bool = True):
     """Print JSON output with optional syntax highlighting"""
-    if pretty:
-        json_str = json.dumps(result, indent=2, default=str)
+    if pretty and console.is_terminal:
+        from rich.syntax import Syntax
+        
+        json_str = dump_json(result).decode('utf-8')
         syntax = Syntax(json_str, "json", theme="monokai", line_numbers=True)
         console.print(syntax)
     else:
-        print(json.dumps(result, default=str))
+        # Highlighting is wasted on pipes and files, so write the bytes directly
+        sys.stdout.flush()
+        sys.stdout.buffer.write(dump_json(result, pretty=pretty) + b"\n")
+        sys.stdout.buffer.flush()
+
+
+def save_json_output(result: dict, output_path: Path) -> None:
+    """Write results as indented JSON in a single buffered write"""
+    data = dump_json(result)
+    with open(output_path, 'wb', buffering=1 << 16) as f:
+        f.write(data)
 
 
 def validate_file_exists(file_path: str) -> Path:
@@ -130,6 +197,160 @@ def validate_file_exists(file_path: str) -> Path:
     return path
 
 
+def match_glob_parts(parts: Tuple[str, ...], pattern_parts: Tuple[str, ...]) -> bool:
+    """Match relative path components against glob components, '**' spanning directories"""
+    if not pattern_parts:
+        return not parts
+    head, rest = pattern_parts[0], pattern_parts[1:]
+    if head == '**':
+        return any(match_glob_parts(parts[i:], rest) for i in range(len(parts) + 1))
+    return bool(parts) and fnmatch(parts[0], head) and match_glob_parts(parts[1:], rest)
+
+
+def walk_files(root: Path, pattern: str, recursive: bool = False) -> Iterator[str]:
+    """
+    Yield paths of files under root matching a glob pattern
+    
+    Matches like ``root.glob(pattern)``, or ``root.rglob(pattern)`` when
+    recursive, so path-style patterns such as ``sub/*.yaml`` or ``**/*.yml``
+    work. Uses os.scandir so the file/directory checks reuse the entry type
+    from the directory listing instead of stat'ing every path again, and
+    only descends as deep as the pattern can match.
+    """
+    pure_pattern = PurePath(pattern)
+    if pure_pattern.is_absolute() or not pure_pattern.parts:
+        raise typer.BadParameter(f"Pattern must be a relative glob: {pattern!r}")
+    
+    pattern_parts = pure_pattern.parts
+    if recursive:
+        pattern_parts = ('**',) + pattern_parts
+    *dir_parts, name_pattern = pattern_parts
+    
+    # Bare name patterns (optionally under '**') only need the file name checked
+    names_only = all(part == '**' for part in dir_parts)
+    unbounded = '**' in dir_parts
+    
+    stack: List[Tuple[str, Tuple[str, ...]]] = [(os.fspath(root), ())]
+    while stack:
+        directory, rel_parts = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except PermissionError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if unbounded or len(rel_parts) < len(dir_parts):
+                        stack.append((entry.path, rel_parts + (entry.name,)))
+                elif entry.is_file() and (
+                    fnmatch(entry.name, name_pattern) if names_only
+                    else match_glob_parts(rel_parts + (entry.name,), pattern_parts)
+                ):
+                    yield entry.path
+
+
+# Bump when the layout of the batch cache file changes
+BATCH_CACHE_FORMAT = 1
+
+
+@lru_cache(maxsize=None)
+def validator_fingerprint() -> str:
+    """Identify the validation rules that produced a set of cached results"""
+    source = Path(__file__).with_name('validator.py').read_bytes()
+    return f'{BATCH_CACHE_FORMAT}:{hashlib.sha256(source).hexdigest()[:16]}'
+
+
+def batch_cache_path(directory: Path) -> Path:
+    """Location of the persistent batch result cache for a directory"""
+    cache_root = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    digest = hashlib.sha256(str(directory.resolve()).encode('utf-8')).hexdigest()
+    return Path(cache_root) / 'dc-validator' / f'{digest[:16]}.json'
+
+
+def load_batch_cache(cache_path: Path) -> dict:
+    """
+    Load cached batch results by absolute path
+    
+    A missing or unreadable cache, or one written by a different version of
+    the validator, is treated as empty.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+        orjson = _get_orjson()
+        cache = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != validator_fingerprint():
+        return {}
+    entries = cache.get('entries')
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_batch_cache(cache_path: Path, cache: dict) -> None:
+    """Persist batch results for reuse by later runs of the same validator"""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'wb', buffering=1 << 16) as f:
+        f.write(dump_json({'version': validator_fingerprint(), 'entries': cache}, pretty=False))
+
+
+def skip_cached(
+    files: Iterable[str],
+    cache: dict,
+    hits: List[dict],
+    stale: Dict[str, list]
+) -> Iterator[str]:
+    """
+    Yield only the files whose cached result is missing or out of date
+    
+    A cache entry is reused when the file's mtime and size both match; a
+    malformed entry counts as a miss. Reused results are appended to ``hits``;
+    the [mtime_ns, size] key of each file that still needs validating is
+    recorded in ``stale`` by absolute path.
+    """
+    for file_path in files:
+        abs_path = os.path.abspath(file_path)
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            yield file_path
+            continue
+        key = [st.st_mtime_ns, st.st_size]
+        entry = cache.get(abs_path)
+        if (
+            isinstance(entry, dict)
+            and entry.get('key') == key
+            and isinstance(entry.get('result'), dict)
+        ):
+            hits.append(entry['result'])
+        else:
+            stale[abs_path] = key
+            yield file_path
+
+
+def validate_batch_file(file_path: str) -> Tuple[dict, bool]:
+    """
+    Validate one file for the batch command inside a worker process
+    
+    Returns the result, which always records the file path, and whether the
+    validator raised instead of reporting a failure.
+    """
+    from validator import validate_dublin_core_yaml
+    
+    try:
+        # Each worker sees a file once, so caching would only cost memory
+        result = validate_dublin_core_yaml(file_path, cache=False)
+    except Exception as e:
+        return {
+            'validation_status': 'FAILED',
+            'error': str(e),
+            'file_path': file_path
+        }, True
+    
+    result.setdefault('file_path', file_path)
+    return result, False
+
+
 @app.command()
 def validate(
     file_path: str = typer.Argument(
@@ -161,6 +382,11 @@ def validate(
         None,
         "--output", "-o",
         help="Save results to file"
+    ),
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        help="Only count elements without schema validation (summary and table formats)"
     )
 ):
     """
@@ -169,6 +395,8 @@ def validate(
     This command validates a YAML file against the Dublin Core metadata standard
     and provides detailed feedback about the validation results.
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from validator import validate_dublin_core_yaml
     
     if quiet:
         verbose = VerbosityLevel.QUIET
@@ -180,6 +408,12 @@ def validate(
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
     
+    # Summary and table output only need element counts, so --fast may skip
+    # the schema validation entirely
+    mode = 'full'
+    if fast and output_format in (OutputFormat.SUMMARY, OutputFormat.TABLE) and not show_details:
+        mode = 'summary'
+    
     # Show progress for verbose modes
     if verbose != VerbosityLevel.QUIET:
         with Progress(
@@ -189,10 +423,10 @@ def validate(
             transient=True
         ) as progress:
             task = progress.add_task("Validating YAML file...", total=None)
-            result = validate_dublin_core_yaml(path)
+            result = validate_dublin_core_yaml(path, mode=mode)
             progress.update(task, completed=True)
     else:
-        result = validate_dublin_core_yaml(path)
+        result = validate_dublin_core_yaml(path, mode=mode)
     
     # Handle output
     if output_format == OutputFormat.JSON:
@@ -217,8 +451,7 @@ def validate(
     if output_file:
         output_path = Path(output_file)
         try:
-            with open(output_path, 'w') as f:
-                json.dump(result, f, indent=2, default=str)
+            save_json_output(result, output_path)
             if verbose != VerbosityLevel.QUIET:
                 console.print(f"[green]Results saved to: {output_path}[/green]")
         except Exception as e:
@@ -262,6 +495,17 @@ def batch(
         False,
         "--summary-only", "-s",
         help="Show only summary statistics"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs", "-j",
+        min=1,
+        help="Number of worker processes (defaults to the CPU count)"
+    ),
+    use_cache: bool = typer.Option(
+        False,
+        "--cache/--no-cache",
+        help="Reuse saved results for files unchanged since the last cached run"
     )
 ):
     """
@@ -270,6 +514,8 @@ def batch(
     This command processes multiple YAML files and provides aggregate statistics
     about the validation results.
     """
+    from concurrent.futures import ProcessPoolExecutor
+    from rich.progress import Progress
     
     dir_path = Path(directory)
     if not dir_path.exists():
@@ -280,54 +526,89 @@ def batch(
         console.print(f"[red]Path is not a directory: {directory}[/red]")
         raise typer.Exit(1)
     
-    # Find files
-    if recursive:
-        files = list(dir_path.rglob(pattern))
-    else:
-        files = list(dir_path.glob(pattern))
+    # Find files lazily so workers can start before the walk finishes
+    files = walk_files(dir_path, pattern, recursive)
     
-    if not files:
+    first_file = next(files, None)
+    if first_file is None:
         console.print(f"[yellow]No files found matching pattern: {pattern}[/yellow]")
         raise typer.Exit(0)
     
-    console.print(f"[blue]Found {len(files)} files to validate[/blue]")
+    files = chain([first_file], files)
+    
+    # Cached results are only reused when a file's mtime and size are unchanged
+    cache_path: Optional[Path] = None
+    cache: dict = {}
+    cached_results: List[dict] = []
+    stale: Dict[str, list] = {}
+    if use_cache:
+        cache_path = batch_cache_path(dir_path)
+        cache = load_batch_cache(cache_path)
+        files = skip_cached(files, cache, cached_results, stale)
     
     results = []
     failed_count = 0
     
-    with Progress(console=console) as progress:
-        task = progress.add_task("Processing files...", total=len(files))
+    with Progress(console=console) as progress, ProcessPoolExecutor(max_workers=jobs) as executor:
+        task = progress.add_task("Processing files...", total=None)
         
-        for file_path in files:
-            try:
-                result = validate_dublin_core_yaml(file_path)
-                results.append(result)
-                
-                if result.get('validation_status') == 'FAILED':
-                    failed_count += 1
-                    if not summary_only:
-                        console.print(f"[red]✗ {file_path.name}: {result.get('error', 'Unknown error')}[/red]")
-                else:
-                    if not summary_only:
-                        console.print(f"[green]✓ {file_path.name}[/green]")
-                        
-            except Exception as e:
+        # Files are validated independently, so fan them out across processes.
+        # map is typed as returning an Iterator, but it is a generator whose
+        # close() cancels the futures that have not started yet.
+        batch_results = cast(
+            Generator[Tuple[dict, bool], None, None],
+            executor.map(validate_batch_file, files, chunksize=BATCH_CHUNKSIZE),
+        )
+        
+        # executor.map drains the file iterator before its last result is
+        # ready, so cached_results is complete by the time it is reached
+        all_results = chain(batch_results, ((result, False) for result in cached_results))
+        
+        unreported = 0
+        for result, raised in all_results:
+            results.append(result)
+            file_name = Path(result['file_path']).name
+            
+            if result.get('validation_status') == 'FAILED':
                 failed_count += 1
-                error_result = {
-                    'validation_status': 'FAILED',
-                    'error': str(e),
-                    'file_path': str(file_path)
-                }
-                results.append(error_result)
-                
                 if not summary_only:
-                    console.print(f"[red]✗ {file_path.name}: {e}[/red]")
+                    console.print(f"[red]✗ {file_name}: {result.get('error', 'Unknown error')}[/red]")
                 
-                if not continue_on_error:
+                if raised:
+                    stale.pop(os.path.abspath(result['file_path']), None)
+                
+                if raised and not continue_on_error:
                     console.print("[red]Stopping due to error (use --continue-on-error to continue)[/red]")
+                    # Closing the map iterator cancels every file not yet
+                    # picked up by a worker; otherwise leaving the executor
+                    # block would still wait for all of them
+                    batch_results.close()
                     break
+            else:
+                if not summary_only:
+                    console.print(f"[green]✓ {file_name}[/green]")
             
-            progress.update(task, advance=1)
+            # Advance the bar once per chunk rather than taking Rich's
+            # progress lock for every single file
+            unreported += 1
+            if unreported >= BATCH_CHUNKSIZE:
+                progress.update(task, advance=unreported)
+                unreported = 0
+        
+        progress.update(task, advance=unreported)
+    
+    if cache_path is not None:
+        fresh_cache = {}
+        for result in results:
+            abs_path = os.path.abspath(result['file_path'])
+            if abs_path in stale:
+                fresh_cache[abs_path] = {'key': stale[abs_path], 'result': result}
+            elif abs_path in cache:
+                fresh_cache[abs_path] = cache[abs_path]
+        try:
+            save_batch_cache(cache_path, fresh_cache)
+        except OSError as e:
+            console.print(f"[yellow]Could not save result cache: {e}[/yellow]")
     
     # Print summary
     passed_count = len(results) - failed_count
@@ -341,7 +622,7 @@ def batch(
     summary_table.add_row("Failed", f"[red]{failed_count}[/red]")
     summary_table.add_row("Success Rate", f"{(passed_count/len(results)*100):.1f}%" if results else "0%")
     
-    console.print(summary_table)
+    print_table(summary_table)
     
     # Save results if requested
     if output_file:
@@ -357,8 +638,7 @@ def batch(
         
         output_path = Path(output_file)
         try:
-            with open(output_path, 'w') as f:
-                json.dump(batch_result, f, indent=2, default=str)
+            save_json_output(batch_result, output_path)
             console.print(f"[green]Batch results saved to: {output_path}[/green]")
         except Exception as e:
             console.print(f"[red]Error saving batch results: {e}[/red]")
@@ -387,6 +667,8 @@ def example(
     This command creates a sample Dublin Core metadata file that demonstrates
     proper structure and validates successfully.
     """
+    from rich.syntax import Syntax
+    from validator import validate_dublin_core_yaml, validate_dublin_core_yaml_str
     
     example_yaml = """dublin_core:
   title:
@@ -532,17 +814,8 @@ metadata_record:
         
         if validate_example:
             console.print("\n[blue]Validating example (in memory)...[/blue]")
-            # Create temporary file for validation
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as tmp:
-                tmp.write(example_yaml)
-                tmp_path = tmp.name
-            
-            try:
-                result = validate_dublin_core_yaml(tmp_path)
-                print_validation_summary(result)
-            finally:
-                Path(tmp_path).unlink()
+            result = validate_dublin_core_yaml_str(example_yaml, file_path='<example>')
+            print_validation_summary(result)
 
 
 @app.command()
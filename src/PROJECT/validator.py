@@ -7,26 +7,51 @@ using Pydantic models with ISO standard compliance.
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import logging
+import mmap
+import os
 import re
-import yaml
+import string
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from functools import wraps, reduce
+from types import ModuleType
+from typing import Any, Callable, Dict, Final, Iterable, Iterator, List, Literal, Optional, Tuple, Type, TypeVar, Union, get_args
+from functools import lru_cache, reduce
 from operator import and_
+from typing_extensions import Annotated
 
 from pydantic import (
     BaseModel, 
+    ConfigDict,
     Field, 
-    validator, 
-    root_validator,
-    HttpUrl,
-    AnyUrl,
-    ValidationError
+    field_validator, 
+    model_validator,
+    AfterValidator,
+    TypeAdapter,
+    ValidationError,
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Stands in for "no document" when a source is not JSON, since None is
+# itself a valid document
+_NO_DOCUMENT = object()
+
+# JSON is a subset of YAML; sources starting like a JSON object or array are
+# tried with a JSON parser first, which is far faster than PyYAML.
+_JSON_START_RE = re.compile(rb'\s*[{\[]')
+
+# Files at least this large are memory-mapped for parsing; below it the
+# extra mmap syscalls cost more than buffered reads.
+_MMAP_THRESHOLD_BYTES = 64 * 1024
+
+
 # =============================================================================
 # ISO Standard Models
 # =============================================================================
@@ -124,83 +149,190 @@ class IdentifierScheme(str, Enum):
     LOCAL = "local"
 
 
+# Plain-string lookup tables for the vocabularies above; membership tests
+# against these are single hash lookups instead of enum coercion.
+_ISO639_1_CODES = frozenset(e.value for e in ISO639_1)
+_ISO3166_1_CODES = frozenset(e.value for e in ISO3166_1)
+_SUBJECT_SCHEMES = frozenset(e.value for e in SubjectScheme)
+_DATE_SCHEMES = frozenset(e.value for e in DateScheme)
+_IDENTIFIER_SCHEMES = frozenset(e.value for e in IdentifierScheme)
+_DCMI_TYPES = frozenset(e.value for e in DCMITypeVocabulary)
+_THREE_LETTER_LANGUAGE_SCHEMES = frozenset({'ISO 639-2', 'ISO 639-3'})
+
+
 # =============================================================================
 # Validation Functions (Functional Approach)
 # =============================================================================
 
+_ISO8601_RE = re.compile(
+    r'^(?:'
+    r'\d{4}-\d{2}-\d{2}'  # YYYY-MM-DD
+    r'(?:T\d{2}:\d{2}:\d{2}(?:\.\d{3})?Z?)?'  # optional THH:MM:SS[.sss][Z]
+    r'|\d{4}/\d{4}'  # YYYY/YYYY for periods
+    r'|\d{4}-\d{2}-\d{2}/\d{4}-\d{2}-\d{2}'  # Date ranges
+    r')$'
+)
+_DOI_RE = re.compile(
+    r'^(https?://)?(dx\.)?doi\.org/10\.\d{4,}/[^\s]+$|^10\.\d{4,}/[^\s]+$',
+    re.IGNORECASE,
+)
+_HYPHEN_SPACE_RE = re.compile(r'[-\s]')
+_ISSN_RE = re.compile(r'^ISSN\s?\d{4}-\d{3}[\dX]$', re.IGNORECASE)
+_ORCID_RE = re.compile(r'^0000-000[1-3]-\d{4}-\d{3}[\dX]$')
+_ISO_DATETIME_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z')
+# Hex digest length for each supported checksum algorithm
+_CHECKSUM_HEX_LENGTHS = {'md5': 32, 'sha1': 40, 'sha256': 64, 'sha512': 128}
+# Structural URL checks only: no IDNA or host parsing, values stay plain str
+_URI_RE = re.compile(r'[A-Za-z][A-Za-z0-9+.-]*:\S+')
+_HTTP_URL_RE = re.compile(r'https?://\S+', re.IGNORECASE)
+_COORD_RE = re.compile(
+    r'^lat:\s*-?\d+\.?\d*-?-?\d+\.?\d*,\s*lon:\s*-?\d+\.?\d*-?-?\d+\.?\d*$'
+)
+
+
 def validate_iso8601_date(date_str: str) -> bool:
     """Validate ISO 8601 date format"""
-    iso8601_patterns = [
-        r'^\d{4}-\d{2}-\d{2}$',  # YYYY-MM-DD
-        r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z?$',  # YYYY-MM-DDTHH:MM:SSZ
-        r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z?$',  # with milliseconds
-        r'^\d{4}/\d{4}$',  # YYYY/YYYY for periods
-        r'^\d{4}-\d{2}-\d{2}/\d{4}-\d{2}-\d{2}$',  # Date ranges
-    ]
-    return any(re.match(pattern, date_str) for pattern in iso8601_patterns)
+    return _ISO8601_RE.match(date_str) is not None
 
 
+# The same ORCIDs, ISSNs and ISBNs recur across records in a batch, so the
+# identifier checks are memoised on the raw string.
+_IDENTIFIER_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def validate_doi(doi: str) -> bool:
     """Validate DOI format (ISO 26324)"""
-    doi_pattern = r'^(https?://)?(dx\.)?doi\.org/10\.\d{4,}/[^\s]+$|^10\.\d{4,}/[^\s]+$'
-    return bool(re.match(doi_pattern, doi, re.IGNORECASE))
+    return bool(_DOI_RE.match(doi))
 
 
+@lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def validate_isbn(isbn: str) -> bool:
     """Validate ISBN format (ISO 2108)"""
     # Remove hyphens and spaces
-    clean_isbn = re.sub(r'[-\s]', '', isbn)
-    isbn_pattern = r'^(97[89])?\d{9}[\dX]$'
-    return bool(re.match(isbn_pattern, clean_isbn))
-
-
+    clean_isbn = _HYPHEN_SPACE_RE.sub('', isbn)
+    if len(clean_isbn) == 13:
+        if not clean_isbn.startswith(('978', '979')):
+            return False
+    elif len(clean_isbn) != 10:
+        return False
+    # Nine or twelve digits followed by a digit or X check character
+    return clean_isbn[:-1].isdecimal() and (
+        clean_isbn[-1].isdecimal() or clean_isbn[-1] == 'X'
+    )
+
+
+@lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def validate_issn(issn: str) -> bool:
     """Validate ISSN format (ISO 3297)"""
-    issn_pattern = r'^ISSN\s?\d{4}-\d{3}[\dX]$'
-    return bool(re.match(issn_pattern, issn, re.IGNORECASE))
+    return bool(_ISSN_RE.match(issn))
 
 
+@lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def validate_orcid(orcid: str) -> bool:
     """Validate ORCID format (ISO 27729)"""
-    orcid_pattern = r'^0000-000[1-3]-\d{4}-\d{3}[\dX]$'
-    return bool(re.match(orcid_pattern, orcid))
+    return bool(_ORCID_RE.match(orcid))
+
+
+def validate_checksum(checksum: str) -> bool:
+    """Validate an <algorithm>:<hex digest> checksum, including digest length"""
+    algorithm, _, digest = checksum.partition(':')
+    return (
+        len(digest) == _CHECKSUM_HEX_LENGTHS.get(algorithm)
+        and not digest.strip(string.hexdigits)
+    )
 
 
 def validate_coordinates(coord_str: str) -> bool:
     """Validate geographic coordinates (ISO 6709 inspired)"""
-    coord_pattern = r'^lat:\s*-?\d+\.?\d*-?-?\d+\.?\d*,\s*lon:\s*-?\d+\.?\d*-?-?\d+\.?\d*$'
-    return bool(re.match(coord_pattern, coord_str))
+    return bool(_COORD_RE.match(coord_str))
+
+
+def validate_uri(uri: str) -> bool:
+    """Validate URI syntax (RFC 3986 scheme followed by a non-blank remainder)"""
+    return _URI_RE.fullmatch(uri) is not None
+
+
+def validate_http_url(url: str) -> bool:
+    """Validate an http(s) URL"""
+    return _HTTP_URL_RE.fullmatch(url) is not None
+
+
+def _check_uri(v: str) -> str:
+    if not validate_uri(v):
+        raise ValueError(f'Invalid URI: {v}')
+    return v
+
+
+def _check_http_url(v: str) -> str:
+    if not validate_http_url(v):
+        raise ValueError(f'Invalid http(s) URL: {v}')
+    return v
+
+
+def _in_vocabulary(codes: frozenset, description: str) -> AfterValidator:
+    """Build a validator accepting only the strings in a closed vocabulary"""
+    def check(v: str) -> str:
+        if v not in codes:
+            raise ValueError(f'Invalid {description}: {v}')
+        return v
+    return AfterValidator(check)
+
+
+Uri = Annotated[str, AfterValidator(_check_uri)]
+HttpUrlStr = Annotated[str, AfterValidator(_check_http_url)]
+LanguageCode = Annotated[str, _in_vocabulary(_ISO639_1_CODES, 'ISO 639-1 language code')]
+CountryCode = Annotated[str, _in_vocabulary(_ISO3166_1_CODES, 'ISO 3166-1 country code')]
+SubjectSchemeStr = Annotated[str, _in_vocabulary(_SUBJECT_SCHEMES, 'subject scheme')]
+DateSchemeStr = Annotated[str, _in_vocabulary(_DATE_SCHEMES, 'date scheme')]
+IdentifierSchemeStr = Annotated[str, _in_vocabulary(_IDENTIFIER_SCHEMES, 'identifier scheme')]
 
 
 # =============================================================================
 # Pydantic Models for Dublin Core Elements
 # =============================================================================
 
+# Vocabularies shared by several elements
+AgentType = Literal['personal', 'corporate', 'conference', 'family']
+
+
 class BaseMetadataElement(BaseModel):
     """Base class for all metadata elements"""
     
-    class Config:
-        extra = "forbid"
-        validate_assignment = True
+    # Field validators only see the fields declared before their own, so a
+    # check that depends on a sibling field (e.g. value against scheme or
+    # type) is a mode='after' model validator on the whole element.
+    
+    # Validated elements are read-only. Models holding List fields (e.g.
+    # DublinCore, AdditionalMetadata) are still unhashable, so never use
+    # them as dict keys or set members.
+    model_config = ConfigDict(extra='forbid', frozen=True)
 
 
 class TitleElement(BaseMetadataElement):
     """DC.Title element"""
     value: str = Field(..., min_length=1, max_length=1000)
-    type: Optional[str] = Field(None, regex=r'^(main|alternative|translated|subtitle|uniform|abbreviated|expanded)$')
-    language: Optional[ISO639_1] = None
+    type: Optional[Literal[
+        'main', 'alternative', 'translated', 'subtitle', 'uniform', 'abbreviated',
+        'expanded',
+    ]] = None
+    language: Optional[LanguageCode] = None
 
 
 class CreatorElement(BaseMetadataElement):
     """DC.Creator element"""
     name: str = Field(..., min_length=1, max_length=500)
-    type: Optional[str] = Field(None, regex=r'^(personal|corporate|conference|family)$')
+    type: Optional[AgentType] = None
     affiliation: Optional[str] = Field(None, max_length=500)
     orcid: Optional[str] = None
-    role: Optional[str] = Field(None, regex=r'^(author|principal investigator|co-investigator|researcher|analyst|institutional author)$')
+    role: Optional[Literal[
+        'author', 'principal investigator', 'co-investigator', 'researcher', 'analyst',
+        'institutional author',
+    ]] = None
     
-    @validator('orcid')
-    def validate_orcid_format(cls, v):
+    @field_validator('orcid')
+    @classmethod
+    def validate_orcid_format(cls, v: Optional[str]) -> Optional[str]:
         if v is not None and not validate_orcid(v):
             raise ValueError('Invalid ORCID format')
         return v
@@ -209,134 +341,172 @@ class CreatorElement(BaseMetadataElement):
 class SubjectElement(BaseMetadataElement):
     """DC.Subject element"""
     value: str = Field(..., min_length=1, max_length=500)
-    scheme: Optional[SubjectScheme] = None
-    uri: Optional[AnyUrl] = None
+    scheme: Optional[SubjectSchemeStr] = None
+    uri: Optional[Uri] = None
     note: Optional[str] = Field(None, max_length=200)
 
 
 class DescriptionElement(BaseMetadataElement):
     """DC.Description element"""
     value: str = Field(..., min_length=1, max_length=5000)
-    type: Optional[str] = Field(None, regex=r'^(abstract|summary|tableOfContents|methods|purpose|scope|provenance|review|version|other)$')
-    language: Optional[ISO639_1] = None
+    type: Optional[Literal[
+        'abstract', 'summary', 'tableOfContents', 'methods', 'purpose', 'scope',
+        'provenance', 'review', 'version', 'other',
+    ]] = None
+    language: Optional[LanguageCode] = None
 
 
 class PublisherElement(BaseMetadataElement):
     """DC.Publisher element"""
     name: str = Field(..., min_length=1, max_length=500)
-    type: Optional[str] = Field(None, regex=r'^(commercial|university|government|society|individual|other)$')
+    type: Optional[Literal[
+        'commercial', 'university', 'government', 'society', 'individual', 'other',
+    ]] = None
     location: Optional[str] = Field(None, max_length=200)
-    website: Optional[HttpUrl] = None
-    role: Optional[str] = Field(None, regex=r'^(publisher|co-publisher|distributor|sponsor)$')
+    website: Optional[HttpUrlStr] = None
+    role: Optional[Literal[
+        'publisher', 'co-publisher', 'distributor', 'sponsor',
+    ]] = None
 
 
 class ContributorElement(BaseMetadataElement):
     """DC.Contributor element"""
     name: str = Field(..., min_length=1, max_length=500)
-    type: Optional[str] = Field(None, regex=r'^(personal|corporate|conference|family)$')
-    role: Optional[str] = Field(None, regex=r'^(editor|translator|illustrator|data collector|advisor|reviewer|sponsor|funder|distributor|graphics design|data analyst|peer reviewer|other)$')
+    type: Optional[AgentType] = None
+    role: Optional[Literal[
+        'editor', 'translator', 'illustrator', 'data collector', 'advisor', 'reviewer',
+        'sponsor', 'funder', 'distributor', 'graphics design', 'data analyst',
+        'peer reviewer', 'other',
+    ]] = None
     affiliation: Optional[str] = Field(None, max_length=500)
 
 
 class DateElement(BaseMetadataElement):
     """DC.Date element"""
     value: str = Field(..., min_length=1)
-    type: Optional[str] = Field(None, regex=r'^(created|valid|available|issued|modified|submitted|accepted|copyrighted|collected|published|temporal_coverage)$')
-    scheme: Optional[DateScheme] = None
+    type: Optional[Literal[
+        'created', 'valid', 'available', 'issued', 'modified', 'submitted', 'accepted',
+        'copyrighted', 'collected', 'published', 'temporal_coverage',
+    ]] = None
+    scheme: Optional[DateSchemeStr] = None
     note: Optional[str] = Field(None, max_length=200)
     
-    @validator('value')
-    def validate_date_format(cls, v, values):
-        scheme = values.get('scheme')
-        if scheme == DateScheme.W3CDTF and not validate_iso8601_date(v):
+    @model_validator(mode='after')
+    def validate_date_format(self) -> DateElement:
+        """Check the value is an ISO 8601 date when the W3CDTF scheme is used"""
+        if self.scheme == DateScheme.W3CDTF and not validate_iso8601_date(self.value):
             raise ValueError('Invalid ISO 8601 date format for W3CDTF scheme')
-        return v
+        return self
 
 
 class TypeElement(BaseMetadataElement):
     """DC.Type element"""
     value: str = Field(..., min_length=1, max_length=200)
-    scheme: Optional[str] = Field(None, regex=r'^(DCMI Type Vocabulary|local|AAT|MARC Genre Terms)$')
-    uri: Optional[AnyUrl] = None
-    
-    @validator('value')
-    def validate_dcmi_type(cls, v, values):
-        scheme = values.get('scheme')
-        if scheme == "DCMI Type Vocabulary":
-            try:
-                DCMITypeVocabulary(v)
-            except ValueError:
-                raise ValueError(f'Invalid DCMI Type: {v}')
-        return v
+    scheme: Optional[Literal[
+        'DCMI Type Vocabulary', 'local', 'AAT', 'MARC Genre Terms',
+    ]] = None
+    uri: Optional[Uri] = None
+    
+    @model_validator(mode='after')
+    def validate_dcmi_type(self) -> TypeElement:
+        """Check the value against the DCMI Type Vocabulary when that scheme is used"""
+        if self.scheme == "DCMI Type Vocabulary" and self.value not in _DCMI_TYPES:
+            raise ValueError(f'Invalid DCMI Type: {self.value}')
+        return self
 
 
 class FormatElement(BaseMetadataElement):
     """DC.Format element"""
     value: str = Field(..., min_length=1, max_length=200)
-    type: Optional[str] = Field(None, regex=r'^(media_type|extent|medium|dimensions|file_size)$')
-    scheme: Optional[str] = Field(None, regex=r'^(IMT|local)$')
+    type: Optional[Literal[
+        'media_type', 'extent', 'medium', 'dimensions', 'file_size',
+    ]] = None
+    scheme: Optional[Literal['IMT', 'local']] = None
 
 
 class IdentifierElement(BaseMetadataElement):
     """DC.Identifier element"""
     value: str = Field(..., min_length=1, max_length=500)
-    type: Optional[str] = Field(None, regex=r'^(DOI|ISBN|ISSN|URI|URL|URN|Handle|PMID|PMC|arXiv|local)$')
-    scheme: Optional[IdentifierScheme] = None
+    type: Optional[Literal[
+        'DOI', 'ISBN', 'ISSN', 'URI', 'URL', 'URN', 'Handle', 'PMID', 'PMC', 'arXiv',
+        'local',
+    ]] = None
+    scheme: Optional[IdentifierSchemeStr] = None
     note: Optional[str] = Field(None, max_length=200)
     
-    @validator('value')
-    def validate_identifier_format(cls, v, values):
-        id_type = values.get('type')
-        if id_type == 'DOI' and not validate_doi(v):
+    @model_validator(mode='after')
+    def validate_identifier_format(self) -> IdentifierElement:
+        """Check the value against the format of its declared identifier type"""
+        if self.type == 'DOI' and not validate_doi(self.value):
             raise ValueError('Invalid DOI format')
-        elif id_type == 'ISBN' and not validate_isbn(v):
+        elif self.type == 'ISBN' and not validate_isbn(self.value):
             raise ValueError('Invalid ISBN format')
-        elif id_type == 'ISSN' and not validate_issn(v):
+        elif self.type == 'ISSN' and not validate_issn(self.value):
             raise ValueError('Invalid ISSN format')
-        return v
+        return self
 
 
 class SourceElement(BaseMetadataElement):
     """DC.Source element"""
     value: str = Field(..., min_length=1, max_length=1000)
-    type: Optional[str] = Field(None, regex=r'^(dataset|publication|website|database|collection|publication_series|conference_proceedings|report|thesis|remote_sensing_data|field_data)$')
+    type: Optional[Literal[
+        'dataset', 'publication', 'website', 'database', 'collection',
+        'publication_series', 'conference_proceedings', 'report', 'thesis',
+        'remote_sensing_data', 'field_data',
+    ]] = None
     identifier: Optional[str] = Field(None, max_length=500)
 
 
 class LanguageElement(BaseMetadataElement):
     """DC.Language element"""
     value: str = Field(..., min_length=2, max_length=3)
-    scheme: Optional[str] = Field(None, regex=r'^(ISO 639-1|ISO 639-2|ISO 639-3|RFC 3066|local)$')
+    scheme: Optional[Literal[
+        'ISO 639-1', 'ISO 639-2', 'ISO 639-3', 'RFC 3066', 'local',
+    ]] = None
     name: Optional[str] = Field(None, max_length=100)
     note: Optional[str] = Field(None, max_length=200)
     
-    @validator('value')
-    def validate_language_code(cls, v, values):
-        scheme = values.get('scheme')
-        if scheme == 'ISO 639-1' and len(v) != 2:
-            raise ValueError('ISO 639-1 codes must be 2 characters')
-        elif scheme in ['ISO 639-2', 'ISO 639-3'] and len(v) != 3:
-            raise ValueError(f'{scheme} codes must be 3 characters')
+    @field_validator('value')
+    @classmethod
+    def normalize_language_code(cls, v: str) -> str:
         return v.lower()
+    
+    @model_validator(mode='after')
+    def validate_language_code(self) -> LanguageElement:
+        """Check the code length required by the declared scheme"""
+        if self.scheme == 'ISO 639-1' and len(self.value) != 2:
+            raise ValueError('ISO 639-1 codes must be 2 characters')
+        elif self.scheme in _THREE_LETTER_LANGUAGE_SCHEMES and len(self.value) != 3:
+            raise ValueError(f'{self.scheme} codes must be 3 characters')
+        return self
 
 
 class RelationElement(BaseMetadataElement):
     """DC.Relation element"""
     value: str = Field(..., min_length=1, max_length=500)
-    type: Optional[str] = Field(None, regex=r'^(isVersionOf|hasVersion|isReplacedBy|replaces|isRequiredBy|requires|isPartOf|hasPart|isReferencedBy|references|isFormatOf|hasFormat|conformsTo|isBasedOn|isBasisFor|continues|isContinuedBy|accompanies|isAccompaniedBy|isSupplementTo|isSupplementedBy)$')
+    type: Optional[Literal[
+        'isVersionOf', 'hasVersion', 'isReplacedBy', 'replaces', 'isRequiredBy',
+        'requires', 'isPartOf', 'hasPart', 'isReferencedBy', 'references', 'isFormatOf',
+        'hasFormat', 'conformsTo', 'isBasedOn', 'isBasisFor', 'continues',
+        'isContinuedBy', 'accompanies', 'isAccompaniedBy', 'isSupplementTo',
+        'isSupplementedBy',
+    ]] = None
     description: Optional[str] = Field(None, max_length=500)
 
 
 class CoverageElement(BaseMetadataElement):
     """DC.Coverage element"""
     value: str = Field(..., min_length=1, max_length=500)
-    type: Optional[str] = Field(None, regex=r'^(spatial|temporal|jurisdiction)$')
-    scheme: Optional[str] = Field(None, regex=r'^(TGN|LCSH|GeoNames|ISO 3166|WGS84|W3CDTF|local)$')
+    type: Optional[Literal['spatial', 'temporal', 'jurisdiction']] = None
+    scheme: Optional[Literal[
+        'TGN', 'LCSH', 'GeoNames', 'ISO 3166', 'WGS84', 'W3CDTF', 'local',
+    ]] = None
     coordinates: Optional[str] = None
     description: Optional[str] = Field(None, max_length=500)
     
-    @validator('coordinates')
-    def validate_coordinate_format(cls, v):
+    @field_validator('coordinates')
+    @classmethod
+    def validate_coordinate_format(cls, v: Optional[str]) -> Optional[str]:
         if v is not None and not validate_coordinates(v):
             raise ValueError('Invalid coordinate format')
         return v
@@ -345,8 +515,11 @@ class CoverageElement(BaseMetadataElement):
 class RightsElement(BaseMetadataElement):
     """DC.Rights element"""
     value: str = Field(..., min_length=1, max_length=1000)
-    type: Optional[str] = Field(None, regex=r'^(copyright|license|access_rights|use_restrictions|data_rights|embargo|terms_of_use)$')
-    uri: Optional[AnyUrl] = None
+    type: Optional[Literal[
+        'copyright', 'license', 'access_rights', 'use_restrictions', 'data_rights',
+        'embargo', 'terms_of_use',
+    ]] = None
+    uri: Optional[Uri] = None
     description: Optional[str] = Field(None, max_length=500)
     note: Optional[str] = Field(None, max_length=200)
 
@@ -359,13 +532,15 @@ class FundingElement(BaseMetadataElement):
     """Funding information"""
     agency: str = Field(..., min_length=1, max_length=300)
     grant_number: Optional[str] = Field(None, max_length=100)
-    country: Optional[ISO3166_1] = None
+    country: Optional[CountryCode] = None
 
 
 class QualityElement(BaseMetadataElement):
     """Quality and provenance information"""
     peer_review: Optional[bool] = None
-    review_type: Optional[str] = Field(None, regex=r'^(single-blind|double-blind|open|post-publication|editorial)$')
+    review_type: Optional[Literal[
+        'single-blind', 'double-blind', 'open', 'post-publication', 'editorial',
+    ]] = None
     editorial_board_approved: Optional[bool] = None
 
 
@@ -378,9 +553,19 @@ class TechnicalElement(BaseMetadataElement):
 
 class PreservationElement(BaseMetadataElement):
     """Preservation metadata"""
-    checksum: Optional[str] = Field(None, regex=r'^(md5|sha1|sha256|sha512):[a-fA-F0-9]+$')
-    preservation_level: Optional[str] = Field(None, regex=r'^(bit-level|logical|full|none)$')
+    checksum: Optional[str] = None
+    preservation_level: Optional[Literal['bit-level', 'logical', 'full', 'none']] = None
     migration_path: Optional[str] = Field(None, max_length=200)
+    
+    @field_validator('checksum')
+    @classmethod
+    def validate_checksum_format(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and not validate_checksum(v):
+            raise ValueError(
+                'Invalid checksum format (expected <algorithm>:<hex digest> using '
+                'md5, sha1, sha256 or sha512 with a full-length digest)'
+            )
+        return v
 
 
 class AdditionalMetadata(BaseMetadataElement):
@@ -393,19 +578,37 @@ class AdditionalMetadata(BaseMetadataElement):
 
 class MetadataRecord(BaseMetadataElement):
     """Metadata about the metadata record"""
-    created_date: Optional[str] = Field(None, regex=r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$')
+    created_date: Optional[str] = None
     created_by: Optional[str] = Field(None, max_length=200)
-    last_modified: Optional[str] = Field(None, regex=r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$')
+    last_modified: Optional[str] = None
     modified_by: Optional[str] = Field(None, max_length=200)
     record_identifier: Optional[str] = Field(None, max_length=100)
     schema_version: Optional[str] = Field(None, max_length=100)
-    encoding: Optional[str] = Field(None, regex=r'^UTF-8$')
+    encoding: Optional[Literal['UTF-8']] = None
+    
+    @field_validator('created_date', 'last_modified')
+    @classmethod
+    def validate_timestamp_format(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and not _ISO_DATETIME_RE.fullmatch(v):
+            raise ValueError('Invalid timestamp format (expected YYYY-MM-DDTHH:MM:SSZ)')
+        return v
 
 
 # =============================================================================
 # Main Dublin Core Model
 # =============================================================================
 
+# The fifteen Dublin Core elements, in report order
+DUBLIN_CORE_ELEMENTS = (
+    'title', 'creator', 'subject', 'description', 'publisher',
+    'contributor', 'date', 'type', 'format', 'identifier',
+    'source', 'language', 'relation', 'coverage', 'rights',
+)
+
+# Validation modes: 'full' checks the schema, 'summary' only counts elements
+VALIDATION_MODES = ('full', 'summary')
+
+
 class DublinCore(BaseMetadataElement):
     """Complete Dublin Core metadata model"""
     title: Optional[List[TitleElement]] = None
@@ -424,14 +627,21 @@ class DublinCore(BaseMetadataElement):
     coverage: Optional[List[CoverageElement]] = None
     rights: Optional[List[RightsElement]] = None
     
-    @root_validator
-    def validate_required_elements(cls, values):
-        """Ensure at least title and one identifier are present"""
-        if not values.get('title'):
-            raise ValueError('At least one title element is required')
-        if not values.get('identifier'):
-            raise ValueError('At least one identifier element is required')
-        return values
+    @model_validator(mode='before')
+    @classmethod
+    def validate_required_elements(cls, data: Any) -> Any:
+        """
+        Ensure at least title and one identifier are present
+        
+        Runs before field validation so documents missing either fail without
+        validating every other element first.
+        """
+        if isinstance(data, dict):
+            if not data.get('title'):
+                raise ValueError('At least one title element is required')
+            if not data.get('identifier'):
+                raise ValueError('At least one identifier element is required')
+        return data
 
 
 class DublinCoreDocument(BaseMetadataElement):
@@ -441,27 +651,177 @@ class DublinCoreDocument(BaseMetadataElement):
     metadata_record: Optional[MetadataRecord] = None
 
 
+# Built once so every validation goes straight to the compiled core validator
+_ADAPTER: Final = TypeAdapter(DublinCoreDocument)
+
+
 # =============================================================================
 # Functional Validation Pipeline
 # =============================================================================
 
-def load_yaml_file(file_path: Path) -> Dict[str, Any]:
-    """Load YAML file and return parsed content"""
+def _read_yaml_source(file_path: Path) -> Union[bytes, mmap.mmap]:
+    """Read a YAML file into memory, memory-mapping it instead when it is large"""
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size < _MMAP_THRESHOLD_BYTES:
+            return file.read()
+        # The mapping stays valid after the file is closed
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+@contextmanager
+def _open_yaml_source(file_path: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Read a YAML file for parsing, unmapping it again afterwards"""
+    source = _read_yaml_source(file_path)
+    try:
+        yield source
+    finally:
+        if isinstance(source, mmap.mmap):
+            source.close()
+
+
+@lru_cache(maxsize=None)
+def _get_yaml() -> Tuple[ModuleType, Type[Any]]:
+    """
+    Import PyYAML and pick its loader on first use
+    
+    Deferred so that importing this module (and CLI paths that never parse
+    YAML) does not pay for PyYAML's resolver and constructor registration.
+    """
+    import yaml
+    
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+        
+        logger.warning(
+            "PyYAML was built without libyaml; falling back to the pure-Python "
+            "SafeLoader, which is considerably slower."
+        )
+    return yaml, loader
+
+
+@lru_cache(maxsize=None)
+def _get_json_loads() -> Callable[[Any], Any]:
+    """Pick orjson's parser when it is installed, else the stdlib one"""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        
+        return lambda buffer: json.loads(bytes(buffer))
+    return orjson.loads
+
+
+def _load_json_document(source: Union[bytes, mmap.mmap]) -> Any:
+    """
+    Parse a source as JSON if it looks like a JSON object or array
+    
+    Returns _NO_DOCUMENT when the source is not JSON (including YAML flow
+    mappings such as ``{title: x}``), so the caller can parse it as YAML.
+    """
+    if not _JSON_START_RE.match(source):
+        return _NO_DOCUMENT
+    try:
+        with memoryview(source) as view:
+            return _get_json_loads()(view)
+    except ValueError:
+        return _NO_DOCUMENT
+
+
+def load_yaml_file(file_path: Path) -> Any:
+    """Load YAML file and return parsed content (any YAML value, not only mappings)"""
+    yaml, loader = _get_yaml()
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
+        with _open_yaml_source(file_path) as source:
+            data = _load_json_document(source)
+            if data is not _NO_DOCUMENT:
+                return data
+            return yaml.load(source, Loader=loader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML format: {e}")
     except FileNotFoundError:
         raise ValueError(f"File not found: {file_path}")
 
 
-def validate_document(data: Dict[str, Any]) -> DublinCoreDocument:
-    """Validate Dublin Core document using Pydantic"""
+def _parse_yaml_documents(stream: Union[bytes, mmap.mmap]) -> Iterator[Any]:
+    """
+    Lazily parse each document in a YAML stream
+    
+    JSON input (a single document, and valid YAML) skips PyYAML entirely.
+    """
+    data = _load_json_document(stream)
+    if data is not _NO_DOCUMENT:
+        yield data
+        return
+    
+    yaml, loader = _get_yaml()
     try:
-        return DublinCoreDocument(**data)
-    except ValidationError as e:
-        raise ValueError(f"Validation failed: {e}")
+        yield from yaml.load_all(stream, Loader=loader)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML format: {e}")
+
+
+def load_yaml_documents(file_path: Path) -> Iterator[Any]:
+    """Yield each document of a (possibly multi-document) YAML file in turn"""
+    try:
+        with _open_yaml_source(file_path) as source:
+            yield from _parse_yaml_documents(source)
+    except FileNotFoundError:
+        raise ValueError(f"File not found: {file_path}")
+
+
+def validate_document(data: Dict[str, Any]) -> DublinCoreDocument:
+    """
+    Validate Dublin Core document using Pydantic
+    
+    Raises pydantic's ValidationError (a ValueError) with the structured
+    error details intact; see validation_failure for turning it into a result.
+    """
+    return _ADAPTER.validate_python(data)
+
+
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """Find the model class inside an annotation such as Optional[List[Model]]"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = _nested_model(arg)
+        if model is not None:
+            return model
+    return None
+
+
+_ModelT = TypeVar('_ModelT', bound=BaseModel)
+
+
+def _construct_trusted(model: Type[_ModelT], data: Dict[str, Any]) -> _ModelT:
+    """Recursively build a model and its nested models without validation"""
+    values = {}
+    for name, value in data.items():
+        field = model.model_fields.get(name)
+        nested = _nested_model(field.annotation) if field is not None else None
+        if nested is not None and isinstance(value, dict):
+            value = _construct_trusted(nested, value)
+        elif nested is not None and isinstance(value, list):
+            value = [
+                _construct_trusted(nested, item) if isinstance(item, dict) else item
+                for item in value
+            ]
+        values[name] = value
+    return model.model_construct(**values)
+
+
+def rehydrate_trusted(data: Dict[str, Any]) -> DublinCoreDocument:
+    """
+    Rebuild a DublinCoreDocument from data that has already been validated
+    
+    validate_document is the single validation boundary. Anything that
+    re-creates documents from its output (e.g. ``model_dump()`` results held
+    in a cache or passed through a filtering pipeline) should use this
+    instead, which skips validation entirely. Never pass untrusted input.
+    """
+    return _construct_trusted(DublinCoreDocument, data)
 
 
 def create_validation_report(document: DublinCoreDocument) -> Dict[str, Any]:
@@ -469,82 +829,329 @@ def create_validation_report(document: DublinCoreDocument) -> Dict[str, Any]:
     dc = document.dublin_core
     
     element_counts = {
-        'title': len(dc.title or []),
-        'creator': len(dc.creator or []),
-        'subject': len(dc.subject or []),
-        'description': len(dc.description or []),
-        'publisher': len(dc.publisher or []),
-        'contributor': len(dc.contributor or []),
-        'date': len(dc.date or []),
-        'type': len(dc.type or []),
-        'format': len(dc.format or []),
-        'identifier': len(dc.identifier or []),
-        'source': len(dc.source or []),
-        'language': len(dc.language or []),
-        'relation': len(dc.relation or []),
-        'coverage': len(dc.coverage or []),
-        'rights': len(dc.rights or []),
+        element: len(value) if (value := getattr(dc, element)) else 0
+        for element in DUBLIN_CORE_ELEMENTS
     }
     
+    return build_report(
+        element_counts,
+        has_additional_metadata=document.additional_metadata is not None,
+        has_metadata_record=document.metadata_record is not None,
+    )
+
+
+def summarize_document(data: Any) -> Dict[str, Any]:
+    """
+    Count the populated elements of a parsed document without validating it
+    
+    Only checks that a ``dublin_core`` mapping is present; the result is
+    marked UNVALIDATED because element contents are never inspected.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get('dublin_core'), dict):
+        raise ValueError("Document has no 'dublin_core' mapping")
+    
+    dc = data['dublin_core']
+    element_counts = {}
+    for element in DUBLIN_CORE_ELEMENTS:
+        value = dc.get(element)
+        element_counts[element] = len(value) if isinstance(value, list) else int(bool(value))
+    
+    return build_report(
+        element_counts,
+        has_additional_metadata=data.get('additional_metadata') is not None,
+        has_metadata_record=data.get('metadata_record') is not None,
+        validation_status='UNVALIDATED',
+    )
+
+
+def build_report(
+    element_counts: Dict[str, int],
+    *,
+    has_additional_metadata: bool,
+    has_metadata_record: bool,
+    validation_status: str = 'PASSED',
+) -> Dict[str, Any]:
+    """Assemble a report dict from per-element counts"""
     total_elements = sum(element_counts.values())
     populated_elements = sum(1 for count in element_counts.values() if count > 0)
     
     return {
-        'validation_status': 'PASSED',
+        'validation_status': validation_status,
         'total_elements': total_elements,
         'populated_elements': populated_elements,
         'completeness_percentage': (populated_elements / 15) * 100,
         'element_counts': element_counts,
-        'has_additional_metadata': document.additional_metadata is not None,
-        'has_metadata_record': document.metadata_record is not None,
+        'has_additional_metadata': has_additional_metadata,
+        'has_metadata_record': has_metadata_record,
+    }
+
+
+def combine_validation_reports(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate the reports of every document in a multi-document file"""
+    element_counts = {
+        element: sum(report['element_counts'][element] for report in reports)
+        for element in reports[0]['element_counts']
+    }
+    
+    report = build_report(
+        element_counts,
+        has_additional_metadata=any(r['has_additional_metadata'] for r in reports),
+        has_metadata_record=any(r['has_metadata_record'] for r in reports),
+        validation_status=reports[0]['validation_status'],
+    )
+    return {
+        **report,
+        'document_count': len(reports),
+        'documents': reports,
     }
 
 
-def validation_decorator(func):
-    """Decorator for handling validation errors"""
-    @wraps(func)
-    def wrapper(*args, **kwargs):
+def report_document(data: Any, mode: str = 'full') -> Dict[str, Any]:
+    """Report on one parsed document in the given validation mode"""
+    if mode == 'summary':
+        return summarize_document(data)
+    return create_validation_report(validate_document(data))
+
+
+def validate_documents(documents: Iterator[Any], mode: str = 'full') -> Dict[str, Any]:
+    """
+    Validate parsed YAML documents one at a time and report on them
+    
+    Only one document is held in memory at a time. A single-document stream
+    produces a plain report; several documents produce a combined report.
+    Empty documents after the first (e.g. from a trailing ``---``) are
+    skipped, but keep their place in the "Document N" numbering.
+    """
+    if mode not in VALIDATION_MODES:
+        raise ValueError(f"Unknown validation mode: {mode}")
+    
+    try:
+        report = report_document(next(documents, None), mode)
+    except ValidationError as e:
+        return validation_failure(e)
+    
+    reports = [report]
+    for index, data in enumerate(documents, start=2):
+        if data is None:
+            continue
         try:
-            return func(*args, **kwargs)
-        except Exception as e:
-            return {
-                'validation_status': 'FAILED',
-                'error': str(e),
-                'error_type': type(e).__name__
-            }
-    return wrapper
-
-
-@validation_decorator
-def validate_dublin_core_yaml(file_path: Union[str, Path]) -> Dict[str, Any]:
+            reports.append(report_document(data, mode))
+        except ValidationError as e:
+            return validation_failure(e, document=index)
+        except ValueError as e:
+            raise ValueError(f"Document {index}: {e}")
+    
+    if len(reports) == 1:
+        return report
+    return combine_validation_reports(reports)
+
+
+def failure_result(error: Exception) -> Dict[str, Any]:
+    """Build the result dict reported for a failed validation"""
+    return {
+        'validation_status': 'FAILED',
+        'error': str(error),
+        'error_type': type(error).__name__
+    }
+
+
+def validation_failure(
+    error: ValidationError,
+    document: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Build the failure result for a schema validation error
+    
+    The structured errors are kept under ``errors``; ``error`` is a one-line
+    summary built from their locations and messages rather than str(error).
+    """
+    errors = error.errors(include_url=False, include_context=False, include_input=False)
+    summary = '; '.join(
+        f"{'.'.join(map(str, err['loc']))}: {err['msg']}" if err['loc'] else err['msg']
+        for err in errors
+    )
+    if document is not None:
+        summary = f"Document {document}: {summary}"
+    return {
+        'validation_status': 'FAILED',
+        'error': f"Validation failed: {summary}",
+        'error_type': type(error).__name__,
+        'errors': errors,
+    }
+
+
+# Upper bound on cached per-file results kept by validate_dublin_core_yaml
+_RESULT_CACHE_SIZE = 4096
+
+
+def _validate_file(abs_path: str, display_path: str, size: int, mode: str) -> Dict[str, Any]:
+    """Validate a file on disk, reporting it under display_path"""
+    try:
+        report = validate_documents(load_yaml_documents(Path(abs_path)), mode)
+    except ValueError as e:
+        return failure_result(e)
+    
+    return {
+        **report,
+        'file_path': display_path,
+        'file_size_bytes': size,
+    }
+
+
+@lru_cache(maxsize=_RESULT_CACHE_SIZE)
+def _validate_file_cached(
+    abs_path: str,
+    display_path: str,
+    mtime_ns: int,
+    size: int,
+    mode: str,
+) -> Dict[str, Any]:
+    """
+    Validate a file, memoised on its identity and stat fingerprint
+    
+    mtime_ns and size only take part in the cache key. OSErrors propagate
+    so that transient failures (e.g. permissions) are never cached.
+    """
+    return _validate_file(abs_path, display_path, size, mode)
+
+
+def validate_dublin_core_yaml(
+    file_path: Union[str, Path],
+    *,
+    mode: str = 'full',
+    cache: bool = True,
+) -> Dict[str, Any]:
     """
     Main validation function using functional composition
     
+    Results are cached in-process, keyed on the file's absolute path,
+    modification time (ns) and size, so re-validating an unchanged file is a
+    lookup while any edit to it produces a fresh result. Use
+    clear_validation_cache() to drop cached results explicitly.
+    
     Args:
         file_path: Path to the YAML file to validate
+        mode: 'full' to validate against the schema, or 'summary' to only
+            count elements without validating them
+        cache: Set to False to validate without reading or filling the
+            cache, for callers that only see each file once
         
     Returns:
-        Dict containing validation results and report
+        Dict containing validation results and report. It is never shared
+        with the cache, so callers may modify it.
     """
     path = Path(file_path)
     
-    # Functional pipeline
-    data = load_yaml_file(path)
-    document = validate_document(data)
-    report = create_validation_report(document)
+    try:
+        stat = path.stat()
+        if not cache:
+            return _validate_file(os.path.abspath(path), str(path), stat.st_size, mode)
+        result = _validate_file_cached(
+            os.path.abspath(path), str(path), stat.st_mtime_ns, stat.st_size, mode
+        )
+    except FileNotFoundError:
+        return failure_result(ValueError(f"File not found: {path}"))
+    except OSError as e:
+        return failure_result(e)
+    
+    return copy.deepcopy(result)
+
+
+def clear_validation_cache() -> None:
+    """Forget all results cached by validate_dublin_core_yaml"""
+    _validate_file_cached.cache_clear()
+
+
+def validate_dublin_core_yaml_str(
+    content: Union[str, bytes, mmap.mmap],
+    *,
+    file_path: str = '<string>',
+    mode: str = 'full',
+) -> Dict[str, Any]:
+    """
+    Validate Dublin Core YAML content without touching the filesystem
+    
+    Args:
+        content: YAML document as text, UTF-8 encoded bytes or a read-only
+            memory map of them
+        file_path: Label reported as the result's file path
+        mode: 'full' to validate against the schema, or 'summary' to only
+            count elements without validating them
+        
+    Returns:
+        Dict containing validation results and report
+    """
+    raw = content.encode('utf-8') if isinstance(content, str) else content
+    
+    try:
+        report = validate_documents(_parse_yaml_documents(raw), mode)
+    except ValueError as e:
+        return failure_result(e)
     
     return {
         **report,
-        'file_path': str(path),
-        'file_size_bytes': path.stat().st_size,
+        'file_path': file_path,
+        'file_size_bytes': len(raw),
     }
 
 
+async def _validate_file_async(file_path: Union[str, Path], mode: str) -> Dict[str, Any]:
+    """Read a file off the event loop, then validate its contents"""
+    path = Path(file_path)
+    loop = asyncio.get_running_loop()
+    try:
+        content = await loop.run_in_executor(None, _read_yaml_source, path)
+    except FileNotFoundError:
+        return failure_result(ValueError(f"File not found: {path}"))
+    except OSError as e:
+        return failure_result(e)
+    try:
+        return validate_dublin_core_yaml_str(content, file_path=str(path), mode=mode)
+    finally:
+        if isinstance(content, mmap.mmap):
+            content.close()
+
+
+async def validate_dublin_core_yamls(
+    file_paths: Iterable[Union[str, Path]],
+    *,
+    batch_size: int = 32,
+    mode: str = 'full',
+) -> List[Dict[str, Any]]:
+    """
+    Validate many YAML files, overlapping file reads with validation
+    
+    Files are processed in batches of ``batch_size``: each batch's reads run
+    concurrently in the default executor while already-read files are
+    validated on the event loop.
+    
+    Args:
+        file_paths: Paths of the YAML files to validate
+        batch_size: Number of files read concurrently
+        mode: 'full' or 'summary', as for validate_dublin_core_yaml
+        
+    Returns:
+        One result dict per file, in input order
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    
+    results: List[Dict[str, Any]] = []
+    paths = iter(file_paths)
+    while True:
+        batch = list(islice(paths, batch_size))
+        if not batch:
+            return results
+        results.extend(await asyncio.gather(
+            *(_validate_file_async(path, mode) for path in batch)
+        ))
+
+
 # =============================================================================
 # CLI Interface and Main Function
 # =============================================================================
 
-def main():
+def main() -> None:
     """Main function for CLI usage"""
     import sys
     import json
@@ -570,7 +1177,7 @@ if __name__ == "__main__":
 # Example Usage Functions
 # =============================================================================
 
-def validate_example_yaml():
+def validate_example_yaml() -> Dict[str, Any]:
     """Example function showing how to use the validator"""
     
     # Example YAML content
@@ -602,19 +1209,13 @@ dublin_core:
       name: "English"
 """
     
-    # Save example to file
-    example_file = Path("example_dublin_core.yaml")
-    with open(example_file, 'w') as f:
-        f.write(example_yaml)
+    import json
     
-    # Validate
-    result = validate_dublin_core_yaml(example_file)
+    # Validate in memory
+    result = validate_dublin_core_yaml_str(example_yaml, file_path='<example>')
     print("Validation Result:")
     print(json.dumps(result, indent=2, default=str))
     
-    # Clean up
-    example_file.unlink()
-    
     return result
 
 
@@ -0,0 +1,143 @@
+"""Tests for the dc-validator command-line interface"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+from typer.testing import CliRunner
+
+# cli.py imports the validator as a top-level module
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "PROJECT"))
+
+import cli  # noqa: E402
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def terminal_console(monkeypatch):
+    """Render through a console that reports itself as a terminal"""
+    console = Console(force_terminal=True, width=120)
+    monkeypatch.setattr(cli, "console", console)
+    return console
+
+
+@pytest.fixture
+def example_file(tmp_path):
+    """The built-in example document, saved to disk"""
+    path = tmp_path / "example.yaml"
+    result = runner.invoke(cli.app, ["example", "--save", str(path)])
+    assert result.exit_code == 0, result.output
+    return path
+
+
+def test_example_renders_tables_on_terminal(terminal_console):
+    result = runner.invoke(cli.app, ["example"])
+
+    assert result.exit_code == 0, result.output
+    assert "Validation Summary" in result.output
+    assert "PASSED" in result.output
+
+
+def test_validate_renders_detailed_tables_on_terminal(terminal_console, example_file):
+    result = runner.invoke(cli.app, ["validate", str(example_file), "--details"])
+
+    assert result.exit_code == 0, result.output
+    assert "Dublin Core Elements" in result.output
+
+
+def test_batch_renders_summary_table_on_terminal(terminal_console, example_file):
+    result = runner.invoke(cli.app, ["batch", str(example_file.parent), "--jobs", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert "Batch Validation Summary" in result.output
+
+
+def test_validate_prints_plain_rows_when_redirected(example_file):
+    result = runner.invoke(cli.app, ["validate", str(example_file)])
+
+    assert result.exit_code == 0, result.output
+    assert "Metric" in result.output
+    assert "┃" not in result.output
+
+
+@pytest.mark.parametrize("pattern", ["*.yaml", "sub/*.yaml", "**/*.yml", "*/deep/*.yaml"])
+@pytest.mark.parametrize("recursive", [False, True])
+def test_walk_files_matches_pathlib_glob(tmp_path, pattern, recursive):
+    for relative in ["a.yaml", "b.yml", "sub/c.yaml", "sub/d.yml", "sub/deep/e.yaml", "other/deep/f.yaml"]:
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("dublin_core: {}\n")
+
+    globbed = tmp_path.rglob(pattern) if recursive else tmp_path.glob(pattern)
+    expected = sorted(str(path) for path in globbed if path.is_file())
+
+    assert expected
+    assert sorted(cli.walk_files(tmp_path, pattern, recursive)) == expected
+
+
+def test_batch_cache_round_trips(tmp_path):
+    cache_path = tmp_path / "cache.json"
+    entries = {"/data/a.yaml": {"key": [1, 2], "result": {"validation_status": "PASSED"}}}
+
+    cli.save_batch_cache(cache_path, entries)
+
+    assert cli.load_batch_cache(cache_path) == entries
+
+
+@pytest.mark.parametrize("stored", [
+    {"version": "0:stale", "entries": {"/data/a.yaml": {"key": [1, 2], "result": {}}}},
+    {"/data/a.yaml": {"key": [1, 2], "result": {}}},
+    [],
+])
+def test_batch_cache_from_another_validator_is_dropped(tmp_path, stored):
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text(json.dumps(stored))
+
+    assert cli.load_batch_cache(cache_path) == {}
+
+
+@pytest.mark.parametrize("make_entry", [
+    lambda key: "not an entry",
+    lambda key: {"result": {"validation_status": "PASSED"}},
+    lambda key: {"key": key},
+    lambda key: {"key": key, "result": None},
+])
+def test_skip_cached_treats_malformed_entries_as_misses(example_file, make_entry):
+    st = example_file.stat()
+    key = [st.st_mtime_ns, st.st_size]
+    cache = {str(example_file): make_entry(key)}
+    hits, stale = [], {}
+
+    remaining = list(cli.skip_cached([str(example_file)], cache, hits, stale))
+
+    assert remaining == [str(example_file)]
+    assert hits == []
+    assert stale == {str(example_file): key}
+
+
+def test_batch_reuses_cached_results(tmp_path, monkeypatch, example_file):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    args = ["batch", str(example_file.parent), "--jobs", "1", "--cache"]
+    first = runner.invoke(cli.app, args)
+    assert first.exit_code == 0, first.output
+
+    # Doctor the saved result so a second run can only report it from the cache
+    cache_path = cli.batch_cache_path(example_file.parent)
+    cache = cli.load_batch_cache(cache_path)
+    cache[str(example_file)]["result"].update(validation_status="FAILED", error="served from cache")
+    cli.save_batch_cache(cache_path, cache)
+    second = runner.invoke(cli.app, args)
+
+    assert "served from cache" in second.output
+
+
+def test_element_labels_cover_the_validator_elements():
+    from validator import DUBLIN_CORE_ELEMENTS
+
+    labels = cli.element_labels()
+
+    assert list(labels) == list(DUBLIN_CORE_ELEMENTS)
+    assert labels["identifier"] == "Identifier"
@@ -0,0 +1,296 @@
+"""Tests for the Dublin Core validator module"""
+
+import mmap
+import sys
+from pathlib import Path
+
+import pytest
+
+# The validator is imported as a top-level module, as cli.py does
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "PROJECT"))
+
+import validator  # noqa: E402
+
+MINIMAL_YAML = """\
+dublin_core:
+  title:
+    - value: "Test Document"
+  identifier:
+    - value: "10.1000/test"
+      type: "DOI"
+"""
+
+
+@pytest.fixture(autouse=True)
+def empty_result_cache():
+    validator.clear_validation_cache()
+    yield
+    validator.clear_validation_cache()
+
+
+@pytest.fixture
+def minimal_file(tmp_path):
+    path = tmp_path / "minimal.yaml"
+    path.write_text(MINIMAL_YAML)
+    return path
+
+
+def test_cached_result_is_not_shared_with_callers(minimal_file):
+    first = validator.validate_dublin_core_yaml(minimal_file)
+    first["element_counts"]["title"] = 99
+    first["validation_status"] = "FAILED"
+
+    second = validator.validate_dublin_core_yaml(minimal_file)
+
+    assert validator._validate_file_cached.cache_info().hits == 1
+    assert second["validation_status"] == "PASSED"
+    assert second["element_counts"]["title"] == 1
+
+
+def test_uncached_validation_leaves_the_cache_empty(minimal_file):
+    result = validator.validate_dublin_core_yaml(minimal_file, cache=False)
+
+    assert result["validation_status"] == "PASSED"
+    assert validator._validate_file_cached.cache_info().currsize == 0
+
+
+@pytest.mark.parametrize("content, expected_count", [
+    (MINIMAL_YAML + "---\n", None),
+    (MINIMAL_YAML + "---\n---\n" + MINIMAL_YAML, 2),
+])
+def test_empty_documents_after_the_first_are_skipped(content, expected_count):
+    result = validator.validate_dublin_core_yaml_str(content)
+
+    assert result["validation_status"] == "PASSED"
+    assert result.get("document_count") == expected_count
+
+
+def test_skipped_empty_documents_keep_their_number():
+    content = MINIMAL_YAML + "---\n---\n" + MINIMAL_YAML.replace("10.1000/test", "bad")
+
+    result = validator.validate_dublin_core_yaml_str(content)
+
+    assert result["error"].startswith("Validation failed: Document 3: ")
+
+
+def as_json(identifier="10.1000/test"):
+    return (
+        '{"dublin_core": {"title": [{"value": "Test Document"}], '
+        f'"identifier": [{{"value": "{identifier}", "type": "DOI"}}]}}}}'
+    )
+
+
+@pytest.mark.parametrize("content, status, document_count, error", [
+    (MINIMAL_YAML, "PASSED", None, None),
+    (MINIMAL_YAML + "---\n" + MINIMAL_YAML, "PASSED", 2, None),
+    (MINIMAL_YAML + "---\n" + MINIMAL_YAML + "---\n" + MINIMAL_YAML, "PASSED", 3, None),
+    (
+        MINIMAL_YAML.replace("10.1000/test", "bad"),
+        "FAILED", None,
+        "Validation failed: dublin_core.identifier.0: Value error, Invalid DOI format",
+    ),
+    (
+        MINIMAL_YAML + "---\n" + MINIMAL_YAML.replace("10.1000/test", "bad"),
+        "FAILED", None,
+        "Validation failed: Document 2: dublin_core.identifier.0: Value error, Invalid DOI format",
+    ),
+    (
+        MINIMAL_YAML + "---\ndublin_core: {}\n",
+        "FAILED", None,
+        "Validation failed: Document 2: dublin_core: Value error, At least one title element is required",
+    ),
+    (as_json(), "PASSED", None, None),
+    (
+        as_json("bad"),
+        "FAILED", None,
+        "Validation failed: dublin_core.identifier.0: Value error, Invalid DOI format",
+    ),
+    ("{dublin_core: {title: [{value: T}], identifier: [{value: 10.1000/x, type: DOI}]}}", "PASSED", None, None),
+    ("dublin_core: [unclosed\n", "FAILED", None, "Invalid YAML format"),
+])
+def test_validate_string(content, status, document_count, error):
+    result = validator.validate_dublin_core_yaml_str(content)
+
+    assert result["validation_status"] == status
+    assert result.get("document_count") == document_count
+    if error is None:
+        assert "error" not in result
+    else:
+        assert result["error"].startswith(error)
+
+
+def test_multi_document_report_sums_element_counts():
+    second = MINIMAL_YAML + "  language:\n    - value: en\n    - value: fr\n"
+
+    result = validator.validate_dublin_core_yaml_str(MINIMAL_YAML + "---\n" + second)
+
+    assert result["element_counts"]["title"] == 2
+    assert result["element_counts"]["language"] == 2
+    assert result["total_elements"] == 6
+    assert result["populated_elements"] == 3
+    assert [doc["total_elements"] for doc in result["documents"]] == [2, 4]
+
+
+@pytest.mark.parametrize("content, status, document_count, error", [
+    (MINIMAL_YAML.replace("10.1000/test", "bad"), "UNVALIDATED", None, None),
+    (MINIMAL_YAML + "---\n" + MINIMAL_YAML, "UNVALIDATED", 2, None),
+    ("title: orphan\n", "FAILED", None, "Document has no 'dublin_core' mapping"),
+    (MINIMAL_YAML + "---\ntitle: orphan\n", "FAILED", None, "Document 2: Document has no 'dublin_core' mapping"),
+])
+def test_summary_mode_counts_without_validating(content, status, document_count, error):
+    result = validator.validate_dublin_core_yaml_str(content, mode="summary")
+
+    assert result["validation_status"] == status
+    assert result.get("document_count") == document_count
+    assert result.get("error") == error
+
+
+def test_summarize_document_counts_scalars_and_lists():
+    report = validator.summarize_document({
+        "dublin_core": {"title": [{"value": "a"}, {"value": "b"}], "rights": {"value": "CC0"}},
+        "metadata_record": {},
+    })
+
+    assert report["element_counts"]["title"] == 2
+    assert report["element_counts"]["rights"] == 1
+    assert report["populated_elements"] == 2
+    assert report["has_metadata_record"] is True
+    assert report["has_additional_metadata"] is False
+
+
+def test_unknown_mode_is_rejected():
+    result = validator.validate_dublin_core_yaml_str(MINIMAL_YAML, mode="quick")
+
+    assert result["validation_status"] == "FAILED"
+    assert result["error"] == "Unknown validation mode: quick"
+
+
+@pytest.mark.parametrize("source, expected", [
+    (b'{"a": 1}', {"a": 1}),
+    (b'  \n[1, 2]', [1, 2]),
+    (b"{a: 1}", validator._NO_DOCUMENT),
+    (b"a: 1", validator._NO_DOCUMENT),
+    (b"", validator._NO_DOCUMENT),
+])
+def test_load_json_document(source, expected):
+    assert validator._load_json_document(source) == expected
+
+
+def test_json_input_never_loads_yaml(monkeypatch):
+    def no_yaml():
+        raise AssertionError("PyYAML should not be needed for JSON input")
+
+    monkeypatch.setattr(validator, "_get_yaml", no_yaml)
+
+    result = validator.validate_dublin_core_yaml_str(as_json())
+
+    assert result["validation_status"] == "PASSED"
+
+
+def large_yaml(min_size):
+    entry = '    - value: "{}"\n'
+    titles = ["Title {}".format(i) for i in range(min_size // len(entry) + 1)]
+    return (
+        "dublin_core:\n  title:\n"
+        + "".join(entry.format(title) for title in titles)
+        + '  identifier:\n    - value: "10.1000/test"\n      type: "DOI"\n'
+    ), len(titles)
+
+
+@pytest.mark.parametrize("size, mapped", [
+    (validator._MMAP_THRESHOLD_BYTES // 2, False),
+    (validator._MMAP_THRESHOLD_BYTES, True),
+])
+def test_large_files_are_memory_mapped(tmp_path, size, mapped):
+    content, title_count = large_yaml(size)
+    path = tmp_path / "large.yaml"
+    path.write_text(content)
+
+    source = validator._read_yaml_source(path)
+    try:
+        assert isinstance(source, mmap.mmap) is mapped
+    finally:
+        if mapped:
+            source.close()
+
+    result = validator.validate_dublin_core_yaml(path)
+    assert result["validation_status"] == "PASSED"
+    assert result["element_counts"]["title"] == title_count
+    assert result["file_size_bytes"] == path.stat().st_size
+
+
+def test_large_json_file_is_memory_mapped_and_parsed(tmp_path):
+    titles = ", ".join('{"value": "Title %d"}' % i for i in range(validator._MMAP_THRESHOLD_BYTES // 20))
+    path = tmp_path / "large.json"
+    path.write_text(
+        '{"dublin_core": {"title": [%s], '
+        '"identifier": [{"value": "10.1000/test", "type": "DOI"}]}}' % titles
+    )
+    assert path.stat().st_size >= validator._MMAP_THRESHOLD_BYTES
+
+    result = validator.validate_dublin_core_yaml(path)
+
+    assert result["validation_status"] == "PASSED"
+    assert result["element_counts"]["title"] == validator._MMAP_THRESHOLD_BYTES // 20
+
+
+@pytest.mark.parametrize("algorithm, length", [("md5", 32), ("sha1", 40), ("sha256", 64), ("sha512", 128)])
+def test_checksum_length_must_match_algorithm(algorithm, length):
+    assert validator.validate_checksum(f"{algorithm}:{'a' * length}")
+    assert validator.validate_checksum(f"{algorithm}:{'0F' * (length // 2)}")
+    assert not validator.validate_checksum(f"{algorithm}:{'a' * (length - 1)}")
+    assert not validator.validate_checksum(f"{algorithm}:{'a' * (length + 1)}")
+
+
+@pytest.mark.parametrize("checksum", [
+    "crc32:" + "a" * 8,
+    "SHA256:" + "a" * 64,
+    "a" * 64,
+    "sha256" + "a" * 64,
+    "sha256:",
+    "md5:" + "a" * 15 + "g" + "a" * 16,
+    "md5:" + "a" * 15 + " " + "a" * 16,
+    "md5:" + "a" * 15 + "-" + "a" * 16,
+    "md5:" + "a" * 32 + " ",
+    "md5:" + "a" * 32 + "\n",
+    "md5:" + "a" * 31 + " ",
+    "md5: " + "a" * 31,
+    "md5:" + "a" * 31 + "١",
+])
+def test_invalid_checksums_are_rejected(checksum):
+    assert not validator.validate_checksum(checksum)
+
+
+def test_missing_libyaml_warns_through_the_module_logger(monkeypatch, caplog):
+    import yaml
+
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    validator._get_yaml.cache_clear()
+    try:
+        with caplog.at_level("WARNING"):
+            _, loader = validator._get_yaml()
+    finally:
+        validator._get_yaml.cache_clear()
+
+    assert loader is yaml.SafeLoader
+    assert [record.name for record in caplog.records] == [validator.__name__]
+
+
+@pytest.mark.parametrize("model, field, good, message", [
+    (validator.TitleElement, "language", "en", "Invalid ISO 639-1 language code: xx"),
+    (validator.DescriptionElement, "language", "fr", "Invalid ISO 639-1 language code: xx"),
+    (validator.SubjectElement, "scheme", "LCSH", "Invalid subject scheme: xx"),
+    (validator.DateElement, "scheme", "W3CDTF", "Invalid date scheme: xx"),
+    (validator.IdentifierElement, "scheme", "URI", "Invalid identifier scheme: xx"),
+    (validator.FundingElement, "country", "US", "Invalid ISO 3166-1 country code: xx"),
+])
+def test_vocabulary_fields(model, field, good, message):
+    required = {"agency": "NSF"} if model is validator.FundingElement else {"value": "2024-01-01"}
+
+    assert getattr(model(**required, **{field: good}), field) == good
+    assert getattr(model(**required), field) is None
+    with pytest.raises(validator.ValidationError) as excinfo:
+        model(**required, **{field: "xx"})
+    [error] = excinfo.value.errors()
+    assert error["loc"] == (field,)
+    assert error["msg"] == f"Value error, {message}"